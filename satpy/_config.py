@@ -50,6 +50,8 @@ _CONFIG_DEFAULTS = {
     "data_dir": _satpy_dirs.user_data_dir,
     "demo_data_dir": ".",
     "download_aux": True,
+    "jit_aggregate_func": False,
+    "parallel_reader_load": False,
     "sensor_angles_position_preference": "actual",
     "readers": {
         "clip_negative_radiances": False,
@@ -1013,6 +1013,21 @@ def prepare_resampler(source_area, destination_area, resampler=None, **resample_
     return key, resampler_instance
 
 
+def _returns_data_on_same_area(resampler=None):
+    """Check if the resampler returns the input data when source and destination areas are the same.
+
+    Resamplers using pyresample's default ``resample`` method skip
+    resampling identical geometries, others (bucket resamplers, EWA, ...)
+    still process the data.
+
+    """
+    if resampler is None:
+        resampler = "kd_tree"
+    if isinstance(resampler, str):
+        resampler = RESAMPLERS.get(resampler)
+    return isinstance(resampler, type) and resampler.resample is PRBaseResampler.resample
+
+
 # TODO: move this to pyresample
 def resample(source_area, data, destination_area,
              resampler=None, **kwargs):
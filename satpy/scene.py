@@ -21,6 +21,8 @@ from __future__ import annotations
 import logging
 import os
 import warnings
+from functools import lru_cache
+from itertools import chain
 from typing import Callable
 
 import numpy as np
@@ -28,18 +30,26 @@ import xarray as xr
 from pyresample.geometry import AreaDefinition, BaseDefinition, SwathDefinition
 from xarray import DataArray
 
+import satpy
 from satpy.composites import IncompatibleAreas
 from satpy.composites.config_loader import load_compositor_configs_for_sensors
 from satpy.dataset import DataID, DataQuery, DatasetDict, combine_metadata, dataset_walker, replace_anc
 from satpy.dependency_tree import DependencyTree
 from satpy.node import CompositorNode, MissingDependencies, ReaderNode
 from satpy.readers import load_readers
-from satpy.resample import get_area_def, prepare_resampler, resample_dataset
+from satpy.resample import _returns_data_on_same_area, get_area_def, prepare_resampler, resample_dataset
 from satpy.utils import convert_remote_files_to_fsspec, get_storage_options_from_reader_kwargs
 from satpy.writers import load_writer
 
 LOG = logging.getLogger(__name__)
 
+_WRITER_BY_EXT = {".tiff": "geotiff", ".tif": "geotiff", ".nc": "cf",
+                  ".mitiff": "mitiff"}
+
+# query used by Scene.load when no filter is requested
+_DEFAULT_LOAD_QUERY = DataQuery(calibration="*", polarization="*", resolution="*",
+                                modifiers="*", level="*")
+
 
 def _get_area_resolution(area):
     """Attempt to retrieve resolution from AreaDefinition."""
@@ -60,6 +70,138 @@ def _aggregate_data_array(data_array, func, **coarsen_kwargs):
     return out
 
 
+def _get_jitted_reducer(func):
+    """Wrap a custom aggregation function so numpy data is reduced by a numba-compiled version of it.
+
+    If numba isn't installed or ``func`` can't be compiled by numba then
+    ``func`` is used as is. Dask arrays are always passed to ``func``
+    directly.
+
+    """
+    try:
+        import numba
+        from numba.core.errors import NumbaError
+    except ImportError:
+        LOG.debug("numba is not available, not compiling aggregation function.")
+        return func
+    try:
+        jitted_func = numba.njit(func)
+    except TypeError:
+        LOG.debug("Can't compile %r with numba, using it without compilation.", func)
+        return func
+    jit_failed = False
+
+    def _reducer(data, axis=None, **kwargs):
+        nonlocal jit_failed
+        if jit_failed or not isinstance(data, np.ndarray):
+            return func(data, axis=axis, **kwargs)
+        try:
+            return jitted_func(data, axis=axis, **kwargs)
+        except (NumbaError, TypeError):
+            LOG.debug("Could not compile %r with numba, using it without compilation.", func)
+            jit_failed = True
+            return func(data, axis=axis, **kwargs)
+    return _reducer
+
+
+def _get_cached_dataid(data_arr, dataid_cache):
+    """Get the DataID of a DataArray, only creating it once per array object.
+
+    The cache is keyed by object identity so it must only be used while all
+    arrays involved are referenced elsewhere (ex. while walking a Scene).
+
+    """
+    try:
+        return dataid_cache[id(data_arr)]
+    except KeyError:
+        ds_id = dataid_cache[id(data_arr)] = DataID.from_dataarray(data_arr)
+        return ds_id
+
+
+@lru_cache(maxsize=32)
+def _get_ll_bbox_crop_area(ll_bbox):
+    """Get the area to crop to for a lon/lat bounding box."""
+    return AreaDefinition(
+        "crop_area", "crop_area", "crop_latlong",
+        {"proj": "latlong"}, 100, 100, ll_bbox)
+
+
+@lru_cache(maxsize=32)
+def _get_xy_bbox_crop_area(crs, width, height, xy_bbox):
+    """Get the area to crop to for a bounding box in projection coordinates."""
+    return AreaDefinition(
+        "crop_area", "crop_area", "crop_xy",
+        crs, width, height, xy_bbox)
+
+
+def _get_area_slices(source_area, destination_area, shape_divisible_by=None):
+    """Get the slices of ``source_area`` covering ``destination_area``.
+
+    Results for pairs of :class:`~pyresample.geometry.AreaDefinition` objects
+    are cached as the polygon intersection involved can be slow.
+
+    """
+    if isinstance(source_area, AreaDefinition) and isinstance(destination_area, AreaDefinition):
+        return _get_area_def_slices(source_area, destination_area, shape_divisible_by)
+    return _compute_area_slices(source_area, destination_area, shape_divisible_by)
+
+
+@lru_cache(maxsize=32)
+def _get_area_def_slices(source_area, destination_area, shape_divisible_by):
+    return _compute_area_slices(source_area, destination_area, shape_divisible_by)
+
+
+def _compute_area_slices(source_area, destination_area, shape_divisible_by):
+    try:
+        return source_area.get_area_slices(
+            destination_area, shape_divisible_by=shape_divisible_by)
+    except TypeError:
+        return source_area.get_area_slices(destination_area)
+
+
+def _all_on_area(datasets, area):
+    """Check if all datasets and their ancillary variables are already on ``area``.
+
+    Only area definitions are compared, a swath is never considered to be on
+    the destination area as comparing it could require computing its
+    coordinates.
+
+    """
+    if not isinstance(area, AreaDefinition):
+        return False
+    for dataset, _ in dataset_walker(datasets):
+        src_area = dataset.attrs.get("area")
+        if src_area is None or src_area is area:
+            continue
+        if not isinstance(src_area, AreaDefinition) or src_area.area_id != area.area_id or src_area != area:
+            return False
+    return True
+
+
+def _get_swath_lonlats(swath_def, data_arrs):
+    """Get the lon/lat DataArrays of a swath to use as coordinates of ``data_arrs``.
+
+    Lon/lats held in memory are chunked like the first dask array found so
+    the coordinates stay lazy and aligned with the data. Lon/lats that are
+    already dask arrays are used as they are.
+
+    """
+    lons, lats = swath_def.get_lonlats()
+    if isinstance(lons, np.ndarray):
+        chunks = _get_yx_chunks(data_arrs)
+        if chunks is not None:
+            lons, lats = swath_def.get_lonlats(chunks=chunks)
+    return DataArray(lons, dims=("y", "x")), DataArray(lats, dims=("y", "x"))
+
+
+def _get_yx_chunks(data_arrs):
+    for data_arr in data_arrs:
+        chunksizes = data_arr.chunksizes
+        if "y" in chunksizes and "x" in chunksizes:
+            return chunksizes["y"], chunksizes["x"]
+    return None
+
+
 class DelayedGeneration(KeyError):
     """Mark that a dataset can't be generated without further modification."""
 
@@ -152,10 +294,13 @@ class Scene:
         self._readers = self._create_reader_instances(filenames=filenames,
                                                       reader=reader,
                                                       reader_kwargs=cleaned_reader_kwargs)
+        self._reader_sensor_names = frozenset(sensor for reader_instance in self._readers.values()
+                                              for sensor in reader_instance.sensor_names)
         self._datasets = DatasetDict()
         self._wishlist = set()
         self._dependency_tree = DependencyTree(self._readers)
         self._resamplers = {}
+        self._known_composites_cache = {}
 
     @property
     def wishlist(self):
@@ -186,14 +331,11 @@ class Scene:
         information for data that isn't actually loaded or even available.
 
         """
-        contained_sensor_names = self._contained_sensor_names()
-        reader_sensor_names = set([sensor for reader_instance in self._readers.values()
-                                   for sensor in reader_instance.sensor_names])
-        return contained_sensor_names | reader_sensor_names
+        return self._contained_sensor_names() | self._reader_sensor_names
 
     def _contained_sensor_names(self) -> set[str]:
         sensor_names = set()
-        for data_arr in self.values():
+        for data_arr in self._datasets.values():
             if "sensor" not in data_arr.attrs:
                 continue
             if isinstance(data_arr.attrs["sensor"], str):
@@ -210,13 +352,11 @@ class Scene:
         will be consulted.
 
         """
-        start_times = [data_arr.attrs["start_time"] for data_arr in self.values()
-                       if "start_time" in data_arr.attrs]
-        if not start_times:
-            start_times = self._reader_times("start_time")
-        if not start_times:
-            return None
-        return min(start_times)
+        start_time = min((data_arr.attrs["start_time"] for data_arr in self._datasets.values()
+                          if "start_time" in data_arr.attrs), default=None)
+        if start_time is None:
+            start_time = min(self._reader_times("start_time"), default=None)
+        return start_time
 
     @property
     def end_time(self):
@@ -227,21 +367,23 @@ class Scene:
         :attr:`Scene.start_time` is returned.
 
         """
-        end_times = [data_arr.attrs["end_time"] for data_arr in self.values()
-                     if "end_time" in data_arr.attrs]
-        if not end_times:
-            end_times = self._reader_times("end_time")
-        if not end_times:
+        end_time = max((data_arr.attrs["end_time"] for data_arr in self._datasets.values()
+                        if "end_time" in data_arr.attrs), default=None)
+        if end_time is None:
+            end_time = max(self._reader_times("end_time"), default=None)
+        if end_time is None:
             return self.start_time
-        return max(end_times)
+        return end_time
 
     def _reader_times(self, time_prop_name):
-        return [getattr(reader, time_prop_name) for reader in self._readers.values()]
+        reader_times = (getattr(reader, time_prop_name) for reader in self._readers.values())
+        return (reader_time for reader_time in reader_times if reader_time is not None)
 
     @property
     def missing_datasets(self):
         """Set of DataIDs that have not been successfully loaded."""
-        return set(self._wishlist) - set(self._datasets.keys())
+        # exact DataID lookups, no need to build (and sort) the full key list
+        return set(ds_id for ds_id in self._wishlist if not self._datasets.contains(ds_id))
 
     def _compare_areas(self, datasets=None, compare_func=max):
         """Compare areas for the provided datasets.
@@ -258,9 +400,12 @@ class Scene:
 
         """
         if datasets is None:
-            datasets = list(self.values())
+            datasets = list(self._datasets.values())
 
         areas = self._gather_all_areas(datasets)
+        if all(area is areas[0] for area in areas[1:]):
+            # common case of all data sharing one area, nothing to compare
+            return areas[0]
 
         if isinstance(areas[0], AreaDefinition):
             first_crs = areas[0].crs
@@ -303,20 +448,23 @@ class Scene:
         an area.
         """
         areas = []
+        first_area_type = None
         for ds in datasets:
             if isinstance(ds, BaseDefinition):
-                areas.append(ds)
-                continue
-            elif not isinstance(ds, DataArray):
-                ds = self[ds]
-            area = ds.attrs.get("area")
+                area = ds
+            else:
+                if not isinstance(ds, DataArray):
+                    ds = self[ds]
+                area = ds.attrs.get("area")
+                if area is None:
+                    continue
+            if first_area_type is None:
+                first_area_type = type(area)
+            elif not isinstance(area, first_area_type):
+                raise ValueError("Can't compare areas of different types")
             areas.append(area)
-        areas = [x for x in areas if x is not None]
         if not areas:
             raise ValueError("No dataset areas available")
-        if not all(isinstance(x, type(areas[0]))
-                   for x in areas[1:]):
-            raise ValueError("Can't compare areas of different types")
         return areas
 
     def finest_area(self, datasets=None):
@@ -407,17 +555,7 @@ class Scene:
         Returns: list of available dataset IDs
 
         """
-        try:
-            if reader_name:
-                readers = [self._readers[reader_name]]
-            else:
-                readers = self._readers.values()
-        except (AttributeError, KeyError):
-            raise KeyError("No reader '%s' found in scene" % reader_name)
-
-        available_datasets = sorted([dataset_id
-                                     for reader in readers
-                                     for dataset_id in reader.available_dataset_ids])
+        available_datasets = sorted(self._iter_reader_dataset_ids(reader_name, available_only=True))
         if composites:
             available_datasets += sorted(self.available_composite_ids())
         return available_datasets
@@ -439,8 +577,10 @@ class Scene:
 
         Returns: list of available dataset names
         """
-        return sorted(set(x["name"] for x in self.available_dataset_ids(
-            reader_name=reader_name, composites=composites)))
+        dataset_ids = self._iter_reader_dataset_ids(reader_name, available_only=True)
+        if composites:
+            dataset_ids = chain(dataset_ids, self.available_composite_ids())
+        return sorted(set(x["name"] for x in dataset_ids))
 
     def all_dataset_ids(self, reader_name=None, composites=False):
         """Get IDs of all datasets from loaded readers or `reader_name` if specified.
@@ -458,17 +598,7 @@ class Scene:
         Returns: list of all dataset IDs
 
         """
-        try:
-            if reader_name:
-                readers = [self._readers[reader_name]]
-            else:
-                readers = self._readers.values()
-        except (AttributeError, KeyError):
-            raise KeyError("No reader '%s' found in scene" % reader_name)
-
-        all_datasets = [dataset_id
-                        for reader in readers
-                        for dataset_id in reader.all_dataset_ids]
+        all_datasets = list(self._iter_reader_dataset_ids(reader_name, available_only=False))
         if composites:
             all_datasets += self.all_composite_ids()
         return all_datasets
@@ -495,14 +625,51 @@ class Scene:
         Returns: list of all dataset names
 
         """
-        return sorted(set(x["name"] for x in self.all_dataset_ids(
-            reader_name=reader_name, composites=composites)))
+        dataset_ids = self._iter_reader_dataset_ids(reader_name, available_only=False)
+        if composites:
+            dataset_ids = chain(dataset_ids, self.all_composite_ids())
+        return sorted(set(x["name"] for x in dataset_ids))
+
+    def _iter_reader_dataset_ids(self, reader_name=None, available_only=False):
+        """Iterate over the dataset IDs of all readers or only `reader_name` if specified.
+
+        The reader lookup happens immediately so a missing reader raises a
+        ``KeyError`` even if the returned iterator is never consumed.
+
+        """
+        try:
+            if reader_name:
+                readers = [self._readers[reader_name]]
+            else:
+                readers = self._readers.values()
+        except (AttributeError, KeyError):
+            raise KeyError("No reader '%s' found in scene" % reader_name)
+
+        id_prop_name = "available_dataset_ids" if available_only else "all_dataset_ids"
+        return (dataset_id for reader in readers for dataset_id in getattr(reader, id_prop_name))
 
     def _check_known_composites(self, available_only=False):
+        """Check what composites we know about, reusing previous results when possible.
+
+        The result only depends on the loaded readers, the sensors they (and
+        the contained data) provide and the configuration path in use, so it
+        is cached on those.
+
+        """
+        sensor_names = self.sensor_names
+        cache_key = (frozenset(sensor_names), available_only, tuple(satpy.config.get("config_path")))
+        try:
+            known_comps = self._known_composites_cache[cache_key]
+        except KeyError:
+            known_comps = self._find_known_composites(sensor_names, available_only)
+            self._known_composites_cache[cache_key] = known_comps
+        return list(known_comps)
+
+    def _find_known_composites(self, sensor_names, available_only):
         """Create new dependency tree and check what composites we know about."""
         # Note if we get compositors from the dep tree then it will include
         # modified composites which we don't want
-        sensor_comps, mods = load_compositor_configs_for_sensors(self.sensor_names)
+        sensor_comps, mods = load_compositor_configs_for_sensors(sensor_names)
         # recreate the dependency tree so it doesn't interfere with the user's
         # wishlist from self._dependency_tree
         dep_tree = DependencyTree(self._readers, sensor_comps, mods, available_only=available_only)
@@ -547,8 +714,7 @@ class Scene:
 
     def __iter__(self):
         """Iterate over the datasets."""
-        for x in self._datasets.values():
-            yield x
+        return iter(self._datasets.values())
 
     def iter_by_area(self):
         """Generate datasets grouped by Area.
@@ -556,10 +722,9 @@ class Scene:
         :return: generator of (area_obj, list of dataset objects)
         """
         datasets_by_area = {}
-        for ds in self:
-            a = ds.attrs.get("area")
-            dsid = DataID.from_dataarray(ds)
-            datasets_by_area.setdefault(a, []).append(dsid)
+        # the container keys are the DataIDs of the arrays, no need to recreate them
+        for dsid, ds in self._datasets.items():
+            datasets_by_area.setdefault(ds.attrs.get("area"), []).append(dsid)
 
         return datasets_by_area.items()
 
@@ -597,63 +762,86 @@ class Scene:
     @property
     def all_same_area(self):
         """All contained data arrays are on the same area."""
-        all_areas = [x.attrs.get("area", None) for x in self.values()]
-        all_areas = [x for x in all_areas if x is not None]
-        return all(all_areas[0] == x for x in all_areas[1:])
+        return self._all_areas_match(lambda first_area, area: first_area == area)
 
     @property
     def all_same_proj(self):
         """All contained data array are in the same projection."""
-        all_areas = [x.attrs.get("area", None) for x in self.values()]
-        all_areas = [x for x in all_areas if x is not None]
-        return all(all_areas[0].crs == x.crs for x in all_areas[1:])
+        return self._all_areas_match(lambda first_area, area: first_area.crs == area.crs)
+
+    def _all_areas_match(self, areas_match):
+        """Check if the areas of all contained data arrays match the first area found.
+
+        Data arrays often share the same area object so identity is checked
+        before the (comparatively expensive) ``areas_match`` comparison.
+
+        """
+        first_area = None
+        for data_arr in self._datasets.values():
+            area = data_arr.attrs.get("area")
+            if area is None or area is first_area:
+                continue
+            if first_area is None:
+                first_area = area
+            elif not areas_match(first_area, area):
+                return False
+        return True
 
     @staticmethod
     def _slice_area_from_bbox(src_area, dst_area, ll_bbox=None,
                               xy_bbox=None):
         """Slice the provided area using the bounds provided."""
         if ll_bbox is not None:
-            dst_area = AreaDefinition(
-                "crop_area", "crop_area", "crop_latlong",
-                {"proj": "latlong"}, 100, 100, ll_bbox)
+            dst_area = _get_ll_bbox_crop_area(tuple(ll_bbox))
         elif xy_bbox is not None:
-            dst_area = AreaDefinition(
-                "crop_area", "crop_area", "crop_xy",
-                src_area.crs, src_area.width, src_area.height,
-                xy_bbox)
+            dst_area = _get_xy_bbox_crop_area(src_area.crs, src_area.width, src_area.height, tuple(xy_bbox))
         x_slice, y_slice = src_area.get_area_slices(dst_area)
         return src_area[y_slice, x_slice], y_slice, x_slice
 
     def _slice_datasets(self, dataset_ids, slice_key, new_area, area_only=True):
         """Slice scene in-place for the datasets specified."""
         new_datasets = {}
+        # sliced versions of the top-level datasets keyed by the id of the
+        # original object so ancillary variables can find their parent
+        new_parents = {}
+        # ancillary variables can be shared by multiple datasets, only
+        # create their DataID once
+        ds_ids = {}
+        # datasets on the same area almost always share dimensions, build each key once
+        keys_by_dims = {}
         datasets = (self[ds_id] for ds_id in dataset_ids)
         for ds, parent_ds in dataset_walker(datasets):
-            ds_id = DataID.from_dataarray(ds)
+            ds_id = _get_cached_dataid(ds, ds_ids)
             # handle ancillary variables
             pres = None
             if parent_ds is not None:
-                parent_dsid = DataID.from_dataarray(parent_ds)
-                pres = new_datasets[parent_dsid]
+                pres = new_parents[id(parent_ds)]
             if ds_id in new_datasets:
                 replace_anc(ds, pres)
+                if parent_ds is None:
+                    new_parents[id(ds)] = new_datasets[ds_id]
                 continue
             if area_only and ds.attrs.get("area") is None:
                 new_datasets[ds_id] = ds
+                if parent_ds is None:
+                    new_parents[id(ds)] = ds
                 replace_anc(ds, pres)
                 continue
 
-            if not isinstance(slice_key, dict):
-                # match dimension name to slice object
-                key = dict(zip(ds.dims, slice_key))
-            else:
+            if isinstance(slice_key, dict):
                 key = slice_key
-            new_ds = ds.isel(**key)
+            elif ds.dims in keys_by_dims:
+                key = keys_by_dims[ds.dims]
+            else:
+                # match dimension name to slice object
+                key = keys_by_dims[ds.dims] = dict(zip(ds.dims, slice_key))
+            new_ds = ds.isel(key)
             if new_area is not None:
                 new_ds.attrs["area"] = new_area
 
             new_datasets[ds_id] = new_ds
             if parent_ds is None:
+                new_parents[id(ds)] = new_ds
                 # don't use `__setitem__` because we don't want this to
                 # affect the existing wishlist/dep tree
                 self._datasets[ds_id] = new_ds
@@ -674,7 +862,6 @@ class Scene:
                                "be usefully sliced.")
         # slice
         new_scn = self.copy()
-        new_scn._wishlist = self._wishlist
         for area, dataset_ids in self.iter_by_area():
             if area is not None:
                 # assume dimensions for area are y and x
@@ -747,12 +934,10 @@ class Scene:
                     new_scn._datasets[ds_id] = self[ds_id]
                 continue
 
-            y_factor, y_remainder = np.divmod(float(src_area.shape[0]),
-                                              coarsest_area.shape[0])
-            x_factor, x_remainder = np.divmod(float(src_area.shape[1]),
-                                              coarsest_area.shape[1])
-            y_factor = int(y_factor)
-            x_factor = int(x_factor)
+            y_factor, y_remainder = divmod(src_area.shape[0],
+                                           coarsest_area.shape[0])
+            x_factor, x_remainder = divmod(src_area.shape[1],
+                                           coarsest_area.shape[1])
             if y_remainder == 0 and x_remainder == 0:
                 y_slice = slice(min_y_slice.start * y_factor,
                                 min_y_slice.stop * y_factor)
@@ -794,6 +979,9 @@ class Scene:
 
         """
         new_scn = self.copy(datasets=dataset_ids)
+        if callable(func) and satpy.config.get("jit_aggregate_func", False):
+            # compile once for all datasets of this call
+            func = _get_jitted_reducer(func)
 
         for src_area, ds_ids in new_scn.iter_by_area():
             if src_area is None:
@@ -804,14 +992,15 @@ class Scene:
             target_area = src_area.aggregate(boundary=boundary, **dim_kwargs)
             resolution = _get_area_resolution(target_area)
             for ds_id in ds_ids:
-                new_scn._datasets[ds_id] = _aggregate_data_array(self[ds_id],
-                                                                 func=func,
-                                                                 boundary=boundary,
-                                                                 side=side,
-                                                                 **dim_kwargs)
-                new_scn._datasets[ds_id].attrs = self[ds_id].attrs.copy()
-                new_scn._datasets[ds_id].attrs["area"] = target_area
-                new_scn._datasets[ds_id].attrs["resolution"] = resolution
+                data_arr = self[ds_id]
+                new_data_arr = _aggregate_data_array(data_arr,
+                                                     func=func,
+                                                     boundary=boundary,
+                                                     side=side,
+                                                     **dim_kwargs)
+                new_scn._datasets[ds_id] = new_data_arr
+                # set attrs after storing as storing updates them from the outdated ds_id
+                new_data_arr.attrs = {**data_arr.attrs, "area": target_area, "resolution": resolution}
         return new_scn
 
     def get(self, key, default=None):
@@ -846,9 +1035,10 @@ class Scene:
         """Slice the data to reduce it."""
         slice_x, slice_y = slices
         dataset = dataset.isel(x=slice_x, y=slice_y)
-        if ("x", source_area.width) not in dataset.sizes.items():
+        sizes = dataset.sizes
+        if sizes.get("x") != source_area.width:
             raise RuntimeError
-        if ("y", source_area.height) not in dataset.sizes.items():
+        if sizes.get("y") != source_area.height:
             raise RuntimeError
         dataset.attrs["area"] = source_area
 
@@ -863,15 +1053,15 @@ class Scene:
         """
         new_datasets = {}
         datasets = list(new_scn._datasets.values())
-        destination_area = self._get_finalized_destination_area(destination_area, new_scn)
 
         resamplers = {}
         reductions = {}
+        dataid_cache = {}
         for dataset, parent_dataset in dataset_walker(datasets):
-            ds_id = DataID.from_dataarray(dataset)
+            ds_id = _get_cached_dataid(dataset, dataid_cache)
             pres = None
             if parent_dataset is not None:
-                pres = new_datasets[DataID.from_dataarray(parent_dataset)]
+                pres = new_datasets[_get_cached_dataid(parent_dataset, dataid_cache)]
             if ds_id in new_datasets:
                 replace_anc(new_datasets[ds_id], pres)
                 if ds_id in new_scn._datasets:
@@ -927,12 +1117,8 @@ class Scene:
                         factor = resample_kwargs.get("shape_divisible_by", 2)
                     else:
                         factor = None
-                    try:
-                        slice_x, slice_y = source_area.get_area_slices(
-                            destination_area, shape_divisible_by=factor)
-                    except TypeError:
-                        slice_x, slice_y = source_area.get_area_slices(
-                            destination_area)
+                    slice_x, slice_y = _get_area_slices(
+                        source_area, destination_area, shape_divisible_by=factor)
                     source_area = source_area[slice_y, slice_x]
                     reductions[key] = (slice_x, slice_y), source_area
                 dataset = self._slice_data(source_area, (slice_x, slice_y), dataset)
@@ -974,8 +1160,12 @@ class Scene:
         if destination is None:
             destination = self.finest_area(datasets)
         new_scn = self.copy(datasets=datasets)
-        self._resampled_scene(new_scn, destination, resampler=resampler,
-                              reduce_data=reduce_data, **resample_kwargs)
+        destination = self._get_finalized_destination_area(destination, new_scn)
+        if _returns_data_on_same_area(resampler) and _all_on_area(new_scn._datasets.values(), destination):
+            LOG.debug("All datasets are already on the destination area, not resampling.")
+        else:
+            self._resampled_scene(new_scn, destination, resampler=resampler,
+                                  reduce_data=reduce_data, **resample_kwargs)
 
         # regenerate anything from the wishlist that needs it (combining
         # multiple resolutions, etc.)
@@ -1093,17 +1283,15 @@ class Scene:
         if len(dataarrays) == 0:
             return xr.Dataset()
 
-        ds_dict = {i.attrs["name"]: i.rename(i.attrs["name"]) for i in dataarrays if i.attrs.get("area") is not None}
+        # variables are named by their key so the arrays don't need renaming
+        ds_dict = {i.attrs["name"]: i for i in dataarrays if i.attrs.get("area") is not None}
         mdata = combine_metadata(*tuple(i.attrs for i in dataarrays))
         if mdata.get("area") is None or not isinstance(mdata["area"], SwathDefinition):
             # either don't know what the area is or we have an AreaDefinition
-            ds = xr.merge(ds_dict.values())
+            ds = xr.merge([ds_dict])
         else:
             # we have a swath definition and should use lon/lat values
-            lons, lats = mdata["area"].get_lonlats()
-            if not isinstance(lons, DataArray):
-                lons = DataArray(lons, dims=("y", "x"))
-                lats = DataArray(lats, dims=("y", "x"))
+            lons, lats = _get_swath_lonlats(mdata["area"], ds_dict.values())
             ds = xr.Dataset(ds_dict, coords={"latitude": lats,
                                              "longitude": lons})
 
@@ -1302,10 +1490,7 @@ class Scene:
         from dask import compute
         new_scn = self.copy()
         datasets = compute(*(new_scn._datasets.values()), **kwargs)
-
-        for i, k in enumerate(new_scn._datasets.keys()):
-            new_scn[k] = datasets[i]
-
+        new_scn._bulk_replace_values(zip(new_scn._datasets, datasets))
         return new_scn
 
     def persist(self, **kwargs):
@@ -1316,10 +1501,7 @@ class Scene:
         from dask import persist
         new_scn = self.copy()
         datasets = persist(*(new_scn._datasets.values()), **kwargs)
-
-        for i, k in enumerate(new_scn._datasets.keys()):
-            new_scn[k] = datasets[i]
-
+        new_scn._bulk_replace_values(zip(new_scn._datasets, datasets))
         return new_scn
 
     def chunk(self, **kwargs):
@@ -1328,11 +1510,20 @@ class Scene:
         See :meth:`xarray.DataArray.chunk` for more details.
         """
         new_scn = self.copy()
-        for k in new_scn._datasets.keys():
-            new_scn[k] = new_scn[k].chunk(**kwargs)
-
+        new_scn._bulk_replace_values(
+            [(k, v.chunk(**kwargs)) for k, v in new_scn._datasets.items()])
         return new_scn
 
+    def _bulk_replace_values(self, keys_values):
+        """Replace the data of datasets already in the Scene.
+
+        Unlike assigning through ``__setitem__`` this doesn't add the datasets to
+        the wishlist or the dependency tree again as the keys are already known.
+
+        """
+        for ds_id, data_arr in keys_values:
+            self._datasets[ds_id] = data_arr
+
     @staticmethod
     def _get_writer_by_ext(extension):
         """Find the writer matching the ``extension``.
@@ -1354,9 +1545,7 @@ class Scene:
             str: The name of the writer to use for this extension.
 
         """
-        mapping = {".tiff": "geotiff", ".tif": "geotiff", ".nc": "cf",
-                   ".mitiff": "mitiff"}
-        return mapping.get(extension.lower(), "simple_image")
+        return _WRITER_BY_EXT.get(extension.lower(), "simple_image")
 
     def _remove_failed_datasets(self, keepables):
         """Remove the datasets that we couldn't create."""
@@ -1387,9 +1576,8 @@ class Scene:
                                   or not.
 
         """
-        to_del = [ds_id for ds_id, projectable in self._datasets.items()
-                  if ds_id not in self._wishlist and (not keepables or ds_id
-                                                      not in keepables)]
+        keep = self._wishlist.union(keepables) if keepables else self._wishlist
+        to_del = [ds_id for ds_id in self._datasets if ds_id not in keep]
         for ds_id in to_del:
             LOG.debug("Unloading dataset: %r", ds_id)
             del self._datasets[ds_id]
@@ -1441,11 +1629,15 @@ class Scene:
             raise TypeError("'load' expects a list of datasets, got a string.")
         dataset_keys = set(wishlist)
         needed_datasets = (self._wishlist | dataset_keys) - set(self._datasets.keys())
-        query = DataQuery(calibration=calibration,
-                          polarization=polarization,
-                          resolution=resolution,
-                          modifiers=modifiers,
-                          level=level)
+        if all(isinstance(val, str) and val == "*"
+               for val in (calibration, polarization, resolution, modifiers, level)):
+            query = _DEFAULT_LOAD_QUERY
+        else:
+            query = DataQuery(calibration=calibration,
+                              polarization=polarization,
+                              resolution=resolution,
+                              modifiers=modifiers,
+                              level=level)
         self._update_dependency_tree(needed_datasets, query)
 
         self._wishlist |= needed_datasets
@@ -1472,7 +1664,10 @@ class Scene:
             DatasetDict of loaded datasets
 
         """
-        nodes = self._dependency_tree.leaves(limit_nodes_to=self.missing_datasets)
+        missing_datasets = self.missing_datasets
+        if not missing_datasets:
+            return DatasetDict()
+        nodes = self._dependency_tree.leaves(limit_nodes_to=missing_datasets)
         return self._read_dataset_nodes_from_storage(nodes, **kwargs)
 
     def _read_dataset_nodes_from_storage(self, reader_nodes, **kwargs):
@@ -1502,12 +1697,31 @@ class Scene:
     def _load_datasets_by_readers(self, reader_datasets, **kwargs):
         # load all datasets for one reader at a time
         loaded_datasets = DatasetDict()
-        for reader_name, ds_ids in reader_datasets.items():
-            reader_instance = self._readers[reader_name]
-            new_datasets = reader_instance.load(ds_ids, **kwargs)
+        if len(reader_datasets) > 1 and satpy.config.get("parallel_reader_load", False):
+            all_new_datasets = self._load_datasets_by_readers_in_threads(reader_datasets, **kwargs)
+        else:
+            all_new_datasets = (self._readers[reader_name].load(ds_ids, **kwargs)
+                                for reader_name, ds_ids in reader_datasets.items())
+        for new_datasets in all_new_datasets:
             loaded_datasets.update(new_datasets)
         return loaded_datasets
 
+    def _load_datasets_by_readers_in_threads(self, reader_datasets, **kwargs):
+        """Load the datasets of each reader in a separate thread.
+
+        Results are returned in the same order as ``reader_datasets``.
+
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _load(reader_name_and_ids):
+            reader_name, ds_ids = reader_name_and_ids
+            return self._readers[reader_name].load(ds_ids, **kwargs)
+
+        max_workers = min(len(reader_datasets), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_load, reader_datasets.items()))
+
     def generate_possible_composites(self, unload):
         """See which composites can be generated and generate them.
 
@@ -1515,15 +1729,19 @@ class Scene:
             unload (bool): if the dependencies of the composites
                            should be unloaded after successful generation.
         """
-        keepables = self._generate_composites_from_loaded_datasets()
+        if self.missing_datasets:
+            keepables = self._generate_composites_from_loaded_datasets()
+        else:
+            # everything requested is loaded, there is nothing to generate
+            keepables = set()
 
         if self.missing_datasets:
             self._remove_failed_datasets(keepables)
         if unload:
             self.unload(keepables=keepables)
 
-    def _filter_loaded_datasets_from_trunk_nodes(self, trunk_nodes):
-        loaded_data_ids = self._datasets.keys()
+    @staticmethod
+    def _filter_loaded_datasets_from_trunk_nodes(trunk_nodes, loaded_data_ids):
         for trunk_node in trunk_nodes:
             if trunk_node.name in loaded_data_ids:
                 continue
@@ -1531,19 +1749,22 @@ class Scene:
 
     def _generate_composites_from_loaded_datasets(self):
         """Compute all the composites contained in `requirements`."""
+        # exact DataIDs hashed once instead of searching the sorted keys per node
+        loaded_data_ids = set(self._datasets)
         trunk_nodes = self._dependency_tree.trunk(limit_nodes_to=self.missing_datasets,
-                                                  limit_children_to=self._datasets.keys())
-        needed_comp_nodes = set(self._filter_loaded_datasets_from_trunk_nodes(trunk_nodes))
+                                                  limit_children_to=loaded_data_ids)
+        needed_comp_nodes = self._filter_loaded_datasets_from_trunk_nodes(trunk_nodes, loaded_data_ids)
         return self._generate_composites_nodes_from_loaded_datasets(needed_comp_nodes)
 
     def _generate_composites_nodes_from_loaded_datasets(self, compositor_nodes):
         """Read (generate) composites."""
         keepables = set()
+        failed_nodes = set()
         for node in compositor_nodes:
-            self._generate_composite(node, keepables)
+            self._generate_composite(node, keepables, failed_nodes)
         return keepables
 
-    def _generate_composite(self, comp_node: CompositorNode, keepables: set):
+    def _generate_composite(self, comp_node: CompositorNode, keepables: set, failed_nodes: set):
         """Collect all composite prereqs and create the specified composite.
 
         Args:
@@ -1552,6 +1773,10 @@ class Scene:
                        when generation is continued later. This can
                        happen if generation is delayed to incompatible
                        areas which would require resampling first.
+            failed_nodes: `set` of composite nodes that can't be generated
+                          because of missing hard requirements. These
+                          aren't tried again by other composites needing
+                          them.
 
         """
         if self._datasets.contains(comp_node.name):
@@ -1568,6 +1793,7 @@ class Scene:
                 comp_node.name,
                 prereqs,
                 keepables,
+                failed_nodes,
             )
         except DelayedGeneration:
             # if we are missing a required dependency that could be generated
@@ -1577,12 +1803,14 @@ class Scene:
         except KeyError:
             # we are missing a hard requirement that will never be available
             # there is no need to "keep" optional dependencies
+            failed_nodes.add(comp_node)
             return
 
         optional_datasets = self._get_prereq_datasets(
             comp_node.name,
             optional_prereqs,
             keepables,
+            failed_nodes,
             skip=True
         )
 
@@ -1591,10 +1819,7 @@ class Scene:
         # so we need to hold on to successfully loaded prerequisites and
         # optional prerequisites
         if delayed_prereq:
-            preservable_datasets = set(self._datasets.keys())
-            prereq_ids = set(p.name for p in prereqs)
-            opt_prereq_ids = set(p.name for p in optional_prereqs)
-            keepables |= preservable_datasets & (prereq_ids | opt_prereq_ids)
+            self._keep_loaded_prereqs(comp_node, keepables)
             return
 
         try:
@@ -1610,17 +1835,20 @@ class Scene:
                 self._wishlist.add(cid)
             self._dependency_tree.update_node_name(comp_node, cid)
         except IncompatibleAreas:
-            LOG.debug("Delaying generation of %s because of incompatible areas", str(compositor.id))
-            preservable_datasets = set(self._datasets.keys())
-            prereq_ids = set(p.name for p in prereqs)
-            opt_prereq_ids = set(p.name for p in optional_prereqs)
-            keepables |= preservable_datasets & (prereq_ids | opt_prereq_ids)
+            LOG.debug("Delaying generation of %s because of incompatible areas", compositor.id)
+            self._keep_loaded_prereqs(comp_node, keepables)
             # even though it wasn't generated keep a list of what
             # might be needed in other compositors
             keepables.add(comp_node.name)
             return
 
-    def _get_prereq_datasets(self, comp_id, prereq_nodes, keepables, skip=False):
+    def _keep_loaded_prereqs(self, comp_node, keepables):
+        """Add the loaded required and optional prerequisites of ``comp_node`` to ``keepables``."""
+        keepables.update(prereq_node.name
+                         for prereq_node in chain(comp_node.required_nodes, comp_node.optional_nodes)
+                         if self._datasets.contains(prereq_node.name))
+
+    def _get_prereq_datasets(self, comp_id, prereq_nodes, keepables, failed_nodes, skip=False):
         """Get a composite's prerequisites, generating them if needed.
 
         Args:
@@ -1630,6 +1858,8 @@ class Scene:
             keepables (set): `set` to update if any prerequisites can't
                              be loaded at this time (see
                              `_generate_composite`).
+            failed_nodes (set): Composite nodes that already failed to be
+                                generated and shouldn't be tried again.
             skip (bool): If True, consider prerequisites as optional and
                          only log when they are missing. If False,
                          prerequisites are considered required and will
@@ -1642,40 +1872,41 @@ class Scene:
         """
         prereq_datasets = []
         delayed_gen = False
+        empty_node = self._dependency_tree.empty_node
         for prereq_node in prereq_nodes:
-            prereq_id = prereq_node.name
-            if prereq_id not in self._datasets and prereq_id not in keepables \
-                    and isinstance(prereq_node, CompositorNode):
-                self._generate_composite(prereq_node, keepables)
-
-            # composite generation may have updated the DataID
-            prereq_id = prereq_node.name
-            if prereq_node is self._dependency_tree.empty_node:
+            if prereq_node is empty_node:
                 # empty sentinel node - no need to load it
                 continue
-            elif prereq_id in self._datasets:
+            prereq_id = prereq_node.name
+            is_comp_node = isinstance(prereq_node, CompositorNode)
+            if is_comp_node and not self._datasets.contains(prereq_id) and prereq_id not in keepables \
+                    and prereq_node not in failed_nodes:
+                self._generate_composite(prereq_node, keepables, failed_nodes)
+                # composite generation may have updated the DataID
+                prereq_id = prereq_node.name
+
+            if self._datasets.contains(prereq_id):
                 prereq_datasets.append(self._datasets[prereq_id])
-            elif isinstance(prereq_node, CompositorNode) and prereq_id in keepables:
+            elif is_comp_node and prereq_id in keepables:
                 delayed_gen = True
                 continue
             elif not skip:
-                LOG.debug("Missing prerequisite for '{}': '{}'".format(
-                    comp_id, prereq_id))
+                LOG.debug("Missing prerequisite for '%s': '%s'", comp_id, prereq_id)
                 raise KeyError("Missing composite prerequisite for"
                                " '{}': '{}'".format(comp_id, prereq_id))
             else:
-                LOG.debug("Missing optional prerequisite for {}: {}".format(comp_id, prereq_id))
+                LOG.debug("Missing optional prerequisite for %s: %s", comp_id, prereq_id)
 
         if delayed_gen:
             keepables.add(comp_id)
             keepables.update([x.name for x in prereq_nodes])
             LOG.debug("Delaying generation of %s because of dependency's delayed generation: %s", comp_id, prereq_id)
             if not skip:
-                LOG.debug("Delayed prerequisite for '{}': '{}'".format(comp_id, prereq_id))
+                LOG.debug("Delayed prerequisite for '%s': '%s'", comp_id, prereq_id)
                 raise DelayedGeneration(
                     "Delayed composite prerequisite for "
                     "'{}': '{}'".format(comp_id, prereq_id))
             else:
-                LOG.debug("Delayed optional prerequisite for {}: {}".format(comp_id, prereq_id))
+                LOG.debug("Delayed optional prerequisite for %s: %s", comp_id, prereq_id)
 
         return prereq_datasets
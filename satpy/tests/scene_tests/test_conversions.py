@@ -18,6 +18,7 @@
 
 import datetime as dt
 
+import numpy as np
 import pytest
 import xarray as xr
 from dask import array as da
@@ -55,6 +56,22 @@ class TestSceneConversions:
         assert len(xrds.variables) == 0
         assert len(xrds.coords) == 0
 
+    def test_to_xarray_dataset_with_swath(self):
+        """Test converting a Scene with numpy lon/lats to xarray dataset keeps the coordinates lazy."""
+        from pyresample.geometry import SwathDefinition
+        scn = Scene()
+        lons = np.arange(16.).reshape((4, 4))
+        lats = np.arange(16.).reshape((4, 4)) / 2
+        area = SwathDefinition(lons, lats)
+        scn["ds1"] = xr.DataArray(da.zeros((4, 4), chunks=2), dims=("y", "x"),
+                                  attrs={"start_time": dt.datetime(2018, 1, 1),
+                                         "area": area})
+        xrds = scn.to_xarray_dataset()
+        assert isinstance(xrds["longitude"].data, da.Array)
+        assert xrds["longitude"].chunks == xrds["ds1"].chunks
+        np.testing.assert_array_equal(xrds["longitude"].values, lons)
+        np.testing.assert_array_equal(xrds["latitude"].values, lats)
+
     def test_geoviews_basic_with_area(self):
         """Test converting a Scene to geoviews with an AreaDefinition."""
         from pyresample.geometry import AreaDefinition
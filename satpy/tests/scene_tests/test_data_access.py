@@ -94,6 +94,23 @@ class TestDataAccessMethods:
                 assert area_obj is None
                 assert ds_list_names == {"3"}
 
+    def test_all_same_area_and_proj(self):
+        """Test checking if all contained data arrays share an area or projection."""
+        from pyresample.geometry import AreaDefinition
+        area1 = AreaDefinition("a1", "a1", "a1", "EPSG:4326", 5, 5, (-10, -10, 10, 10))
+        area2 = AreaDefinition("a2", "a2", "a2", "EPSG:4326", 5, 5, (-20, -20, 20, 20))
+        scene = Scene()
+        assert scene.all_same_area
+        assert scene.all_same_proj
+        scene["1"] = xr.DataArray(np.zeros((5, 5)), dims=("y", "x"), attrs={"area": area1})
+        scene["2"] = xr.DataArray(np.zeros((5, 5)), dims=("y", "x"), attrs={"area": area1})
+        scene["3"] = xr.DataArray(np.zeros((5, 5)), dims=("y", "x"))
+        assert scene.all_same_area
+        assert scene.all_same_proj
+        scene["4"] = xr.DataArray(np.zeros((5, 5)), dims=("y", "x"), attrs={"area": area2})
+        assert not scene.all_same_area
+        assert scene.all_same_proj
+
     def test_bad_setitem(self):
         """Test setting an item wrongly."""
         scene = Scene()
@@ -223,6 +240,29 @@ class TestDataAccessMethods:
         a_var = new_scn2["4a"].attrs["ancillary_variables"][0]
         assert a_var.shape == (3, 6)
 
+    def test_getitem_slices_dask(self):
+        """Test that slicing dask-based data only adds a single slicing layer to each graph."""
+        from pyresample.geometry import AreaDefinition
+        area_def = AreaDefinition("test", "test", "test", "EPSG:4326", 10, 5, (-10., -5., 10., 5.))
+        scene = Scene()
+        scene["1"] = xr.DataArray(da.zeros((5, 10), chunks=2), dims=("y", "x"), attrs={"area": area_def})
+        scene["2"] = xr.DataArray(da.ones((5, 10), chunks=2), dims=("y", "x"), attrs={"area": area_def})
+        new_scn = scene[2:5, 2:8]
+        for name in ("1", "2"):
+            assert isinstance(new_scn[name].data, da.Array)
+            assert new_scn[name].shape == (3, 6)
+            assert len(new_scn[name].data.dask.layers) == len(scene[name].data.dask.layers) + 1
+
+    def test_getitem_slices_wishlist_not_shared(self):
+        """Test that a sliced Scene gets its own copy of the wishlist."""
+        scene = Scene()
+        scene["1"] = xr.DataArray(np.zeros((5, 10)), dims=("y", "x"))
+        new_scn = scene[2:5, 2:8]
+        assert new_scn._wishlist == scene._wishlist
+        assert new_scn._wishlist is not scene._wishlist
+        del new_scn["1"]
+        assert len(scene._wishlist) == 1
+
     def test_contains(self):
         """Test contains."""
         scene = Scene()
@@ -368,6 +408,32 @@ class TestFinestCoarsestArea:
         # doesn't matter what order they were added, this should be the same area
         assert coarse_area2 is course_area1
 
+    @pytest.mark.parametrize(("deprecated_meth", "meth"), [("max_area", "finest_area"), ("min_area", "coarsest_area")])
+    def test_deprecated_min_max_area(self, deprecated_meth, meth):
+        """Test that the deprecated area methods warn on every call."""
+        coarse_area = _create_coarsest_finest_area_def((2, 5), (1000.0, 1500.0, -1000.0, -1500.0))
+        fine_area = _create_coarsest_finest_area_def((4, 10), (1000.0, 1500.0, -1000.0, -1500.0))
+        scn = Scene()
+        scn["1"] = _create_coarest_finest_data_array(coarse_area.shape, coarse_area)
+        scn["2"] = _create_coarest_finest_data_array(fine_area.shape, fine_area)
+        for _ in range(2):
+            with pytest.warns(DeprecationWarning, match=f"'{deprecated_meth}' is deprecated"):
+                area = getattr(scn, deprecated_meth)()
+            assert area is getattr(scn, meth)()
+
+    def test_coarsest_finest_area_bad_areas(self):
+        """Test that missing areas or areas of different types can't be compared."""
+        area_def = _create_coarsest_finest_area_def((2, 5), (-1000.0, -1500.0, 1000.0, 1500.0))
+        swath_def = _create_coarsest_finest_swath_def((2, 5), (-1000.0, -1500.0, 1000.0, 1500.0), "1")
+        scn = Scene()
+        scn["no_area"] = xr.DataArray(np.zeros((2, 5)), dims=("y", "x"))
+        with pytest.raises(ValueError, match="No dataset areas available"):
+            scn.finest_area()
+        scn["area"] = _create_coarest_finest_data_array(area_def.shape, area_def)
+        scn["swath"] = _create_coarest_finest_data_array(swath_def.shape, swath_def)
+        with pytest.raises(ValueError, match="Can't compare areas of different types"):
+            scn.coarsest_area()
+
 
 @pytest.mark.usefixtures("include_test_etc")
 class TestComputePersist:
@@ -381,6 +447,16 @@ class TestComputePersist:
         scene = scene.compute()
         assert isinstance(scene["ds1"].data, np.ndarray)
 
+    def test_compute_keeps_dataset_order(self):
+        """Test that computed data is assigned back to the right datasets."""
+        scene = Scene()
+        scene["b"] = xr.DataArray(da.ones((2, 2)), dims=("y", "x"))
+        scene["a"] = xr.DataArray(da.zeros((2, 2)), dims=("y", "x"))
+        new_scn = scene.compute()
+        np.testing.assert_array_equal(new_scn["a"].values, scene["a"].values)
+        np.testing.assert_array_equal(new_scn["b"].values, scene["b"].values)
+        assert new_scn._wishlist == scene._wishlist
+
     def test_persist_pass_through(self):
         """Test pass through of xarray persist."""
         from dask.array.utils import assert_eq
@@ -133,6 +133,17 @@ class TestSceneAllAvailableDatasets:
         available_comp_ids = scene.available_composite_ids()
         assert make_cid(name="static_image") in available_comp_ids
 
+    def test_known_composites_cached(self):
+        """Test that repeated composite queries reuse the previous result."""
+        scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+        with mock.patch.object(scene, "_find_known_composites", wraps=scene._find_known_composites) as find_comps:
+            first_ids = scene.available_composite_ids()
+            first_ids.append("not_a_composite")
+            assert scene.available_composite_ids() == first_ids[:-1]
+            assert find_comps.call_count == 1
+            scene.all_composite_ids()
+            assert find_comps.call_count == 2
+
     def test_available_when_sensor_none_in_preloaded_dataarrays(self):
         """Test Scene available composites when existing loaded arrays have sensor set to None.
 
@@ -277,6 +288,20 @@ class TestLoadingReaderDatasets:
         loaded_ids = list(scene._datasets.keys())
         assert len(loaded_ids) == 0
 
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_load_multiple_readers(self, parallel):
+        """Test loading datasets from multiple readers with and without threads."""
+        import satpy
+        scene = Scene(filenames={"fake1_1ds": ["fake1_1ds_1.txt"],
+                                 "fake2_1ds": ["fake2_1ds_1.txt"]})
+        with satpy.config.set(parallel_reader_load=parallel), \
+                mock.patch.object(scene, "_load_datasets_by_readers_in_threads",
+                                  wraps=scene._load_datasets_by_readers_in_threads) as threaded_load:
+            scene.load(["ds1", "ds2"])
+        assert "ds1" in scene
+        assert "ds2" in scene
+        assert threaded_load.called == parallel
+
 
 @pytest.mark.usefixtures("include_test_etc")
 class TestLoadingComposites:
@@ -543,8 +568,8 @@ class TestLoadingComposites:
                 assert make_dataid(
                     name="ds1", resolution=250, calibration="reflectance", modifiers=tuple()
                 ) in loaded_ids
-                # m.assert_called_once_with(set([scene._dependency_tree['ds1']]))
-                m.assert_called_once_with(set())
+                # everything requested is loaded so there is nothing to generate
+                m.assert_not_called()
             with mock.patch.object(scene, "_generate_composites_nodes_from_loaded_datasets",
                                    wraps=scene._generate_composites_nodes_from_loaded_datasets) as m:
                 scene.load(["ds1"])
@@ -555,7 +580,7 @@ class TestLoadingComposites:
                 assert make_dataid(
                     name="ds1", resolution=250, calibration="reflectance", modifiers=tuple()
                 ) in loaded_ids
-                m.assert_called_once_with(set())
+                m.assert_not_called()
             # we should only generate the comp10 composite once but comp2 was also generated
             assert comp_mock.mock.call_count == 1 + 1
             # Create the modded ds1 at comp10, then load the umodified version
@@ -580,6 +605,26 @@ class TestLoadingComposites:
         assert "comp10" in scene._datasets
         assert not scene.missing_datasets
 
+    def test_failed_shared_prereq_generated_once(self):
+        """Test that a composite missing a requirement is only tried once when shared by other composites."""
+        from satpy.node import CompositorNode, ReaderNode
+
+        def _comp_node(name, required):
+            compositor = mock.MagicMock(id=make_cid(name=name))
+            node = CompositorNode(compositor)
+            node.add_required_nodes(required)
+            return node
+
+        failing_node = _comp_node("failing", [ReaderNode(make_dataid(name="missing"), "fake1")])
+        comp_nodes = {_comp_node("comp_a", [failing_node]), _comp_node("comp_b", [failing_node])}
+        scene = Scene()
+        with mock.patch.object(scene, "_generate_composite", wraps=scene._generate_composite) as gen_comp:
+            keepables = scene._generate_composites_nodes_from_loaded_datasets(comp_nodes)
+        generated_names = [call.args[0].name["name"] for call in gen_comp.call_args_list]
+        assert sorted(generated_names) == ["comp_a", "comp_b", "failing"]
+        assert not keepables
+        failing_node.compositor.assert_not_called()
+
     def test_modified_with_wl_dep(self):
         """Test modifying a dataset with a modifier with modified deps.
 
@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU General Public License along with
 # satpy.  If not, see <http://www.gnu.org/licenses/>.
 """Unit tests for resampling and crop-related functionality in scene.py."""
+import logging
 from unittest import mock
 
 import numpy as np
@@ -30,6 +31,15 @@ from satpy.tests.utils import make_cid, make_dataid
 # - include_test_etc
 
 
+@pytest.fixture(autouse=True)
+def _clear_area_slices_cache():
+    """Make sure area slices cached by one test (possibly mocked) aren't used by another."""
+    from satpy.scene import _get_area_def_slices
+    _get_area_def_slices.cache_clear()
+    yield
+    _get_area_def_slices.cache_clear()
+
+
 class TestSceneCrop:
     """Test creating new Scenes by cropping an existing Scene."""
 
@@ -108,6 +118,21 @@ class TestSceneCrop:
         assert new_scn1["3"].shape == (36, 70)
         assert new_scn1["4"].shape == (18, 35)
 
+    def test_crop_bbox_area_reused(self):
+        """Test that cropping repeatedly to the same bounding box reuses the crop area."""
+        from pyresample.geometry import AreaDefinition
+
+        area_def = AreaDefinition("test", "test", "test", "EPSG:32630", 100, 100,
+                                  (699960.0, 5390220.0, 809760.0, 5500020.0))
+        ll_bbox = [0., 48.8, 0.5, 49.2]
+        xy_bbox = [719695.7, 5427887.4, 725068.1, 5433708.3]
+        exp_ll_slices = Scene._slice_area_from_bbox(area_def, None, ll_bbox=ll_bbox)
+        exp_xy_slices = Scene._slice_area_from_bbox(area_def, None, xy_bbox=xy_bbox)
+        with mock.patch("satpy.scene.AreaDefinition", wraps=AreaDefinition) as area_def_cls:
+            assert Scene._slice_area_from_bbox(area_def, None, ll_bbox=ll_bbox)[1:] == exp_ll_slices[1:]
+            assert Scene._slice_area_from_bbox(area_def, None, xy_bbox=xy_bbox)[1:] == exp_xy_slices[1:]
+        area_def_cls.assert_not_called()
+
     def test_crop_epsg_crs(self):
         """Test the crop method when source area uses an EPSG code."""
         from pyresample.geometry import AreaDefinition
@@ -327,9 +352,34 @@ class TestSceneResampling:
             # once for default (reduce_data=True)
             # once for kwarg forced to `True`
             assert slice_data.call_count == 2 * 3
-            # get area slices is called again, once per area
-            assert get_area_slices.call_count == 2
-            assert get_area_slices_big.call_count == 2
+            # area slices are reused from the first reducing resample
+            assert get_area_slices.call_count == 1
+            assert get_area_slices_big.call_count == 1
+
+    @mock.patch("satpy.scene.resample_dataset")
+    def test_resample_to_same_area(self, rs):
+        """Test that data already on the destination area isn't resampled by resamplers that would return it as is."""
+        from pyresample.geometry import AreaDefinition
+        rs.side_effect = self._fake_resample_dataset
+        area_def = AreaDefinition("test", "test", "test", "EPSG:4326", 5, 5, (-10., -5., 10., 5.))
+        same_area_def = AreaDefinition("test", "test", "test", "EPSG:4326", 5, 5, (-10., -5., 10., 5.))
+        scene = Scene()
+        scene["1"] = xr.DataArray(da.zeros((5, 5)), dims=("y", "x"), attrs={"area": area_def})
+        scene["2"] = xr.DataArray(da.zeros((5, 5)), dims=("y", "x"), attrs={"area": same_area_def})
+
+        new_scn = scene.resample(area_def)
+        rs.assert_not_called()
+        assert new_scn["1"].attrs["area"] == area_def
+        assert new_scn["2"].attrs["area"] == area_def
+
+        scene.resample(area_def, resampler="bucket_avg")
+        assert rs.call_count == 2
+
+        scene["3"] = xr.DataArray(da.zeros((5, 5)), dims=("y", "x"), attrs={
+            "area": AreaDefinition("other", "other", "other", "EPSG:4326", 5, 5, (-10., -5., 10., 5.))})
+        rs.reset_mock()
+        scene.resample(area_def)
+        assert rs.call_count == 3
 
     def test_resample_ancillary(self):
         """Test that the Scene reducing data does not affect final output."""
@@ -549,6 +599,15 @@ class TestSceneResampling:
         assert "ds13" in new_scene
 
 
+def _sum_2d_windows(data, axis=None):
+    """Sum coarsen windows in a numba-compatible way."""
+    out = np.zeros((data.shape[0], data.shape[2]), dtype=data.dtype)
+    for y_idx in range(data.shape[0]):
+        for x_idx in range(data.shape[2]):
+            out[y_idx, x_idx] = data[y_idx, :, x_idx, :].sum()
+    return out
+
+
 class TestSceneAggregation:
     """Test the scene's aggregate method."""
 
@@ -574,6 +633,61 @@ class TestSceneAggregation:
         expected_aggregated_shape = (y_size / 2, x_size / 2)
         self._check_aggregation_results(expected_aggregated_shape, scene1, scene2, x_size, y_size)
 
+    @pytest.mark.parametrize(("func", "compiled"), [(np.sum, False), (_sum_2d_windows, True)])
+    def test_custom_aggregate_jitted(self, func, compiled, caplog):
+        """Test the aggregate method with a custom function and numba compilation enabled."""
+        import satpy
+        numba = pytest.importorskip("numba")
+        x_size = 3712
+        y_size = 3712
+
+        scene1 = self._create_test_data(x_size, y_size)
+
+        jitted_funcs = []
+        orig_njit = numba.njit
+
+        def _njit(func):
+            jitted_func = orig_njit(func)
+            jitted_funcs.append(jitted_func)
+            return jitted_func
+
+        with satpy.config.set(jit_aggregate_func=True), \
+                mock.patch("numba.njit", side_effect=_njit) as njit, \
+                caplog.at_level(logging.DEBUG, logger="satpy.scene"):
+            scene2 = scene1.aggregate(func=func, x=2, y=2)
+        # compiled once for both aggregated datasets, numba also uses njit internally while compiling
+        assert njit.call_args_list.count(mock.call(func)) == 1
+        assert njit.call_args_list[0] == mock.call(func)
+        if compiled:
+            assert jitted_funcs[0].signatures
+        else:
+            assert not jitted_funcs
+            assert "using it without compilation" in caplog.text
+        expected_aggregated_shape = (y_size / 2, x_size / 2)
+        self._check_aggregation_results(expected_aggregated_shape, scene1, scene2, x_size, y_size)
+
+    def test_custom_aggregate_jitted_unhashable(self):
+        """Test that an unhashable custom function can be used with numba compilation enabled."""
+        import satpy
+        pytest.importorskip("numba")
+
+        class _UnhashableSum:
+            def __eq__(self, other):
+                return isinstance(other, _UnhashableSum)
+
+            def __call__(self, data, axis=None):
+                return np.sum(data, axis=axis)
+
+        x_size = 3712
+        y_size = 3712
+
+        scene1 = self._create_test_data(x_size, y_size)
+
+        with satpy.config.set(jit_aggregate_func=True):
+            scene2 = scene1.aggregate(func=_UnhashableSum(), x=2, y=2)
+        expected_aggregated_shape = (y_size / 2, x_size / 2)
+        self._check_aggregation_results(expected_aggregated_shape, scene1, scene2, x_size, y_size)
+
     @staticmethod
     def _create_test_data(x_size, y_size):
         from pyresample.geometry import AreaDefinition
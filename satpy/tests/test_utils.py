@@ -480,6 +480,19 @@ def test_convert_remote_files_to_fsspec_local_files():
     assert res == filenames
 
 
+def test_convert_remote_files_to_fsspec_local_files_fast_path():
+    """Test that plain local filenames are not parsed one by one."""
+    import pathlib
+
+    from satpy.utils import convert_remote_files_to_fsspec
+
+    filenames = ("/tmp/file1.nc", pathlib.Path("/tmp/file2.nc"), r"C:\wintendo\file3.nc")
+    with mock.patch("satpy.utils._sort_files_to_local_remote_and_fsfiles") as sort_files:
+        res = convert_remote_files_to_fsspec(filenames)
+    sort_files.assert_not_called()
+    assert res == list(filenames)
+
+
 def test_convert_remote_files_to_fsspec_local_pathlib_files():
     """Test convertion of remote files to fsspec objects.
 
@@ -747,6 +747,10 @@ def _check_file_protocols_for_dicts(filenames, storage_options):
 
 
 def _check_file_protocols(filenames, storage_options):
+    filenames = list(filenames)
+    if all(_is_plain_local_path(f) for f in filenames):
+        # common case, nothing to convert
+        return filenames
     local_files, remote_files, fs_files = _sort_files_to_local_remote_and_fsfiles(filenames)
 
     if remote_files:
@@ -755,6 +759,11 @@ def _check_file_protocols(filenames, storage_options):
     return local_files + fs_files
 
 
+def _is_plain_local_path(filename):
+    """Check if the filename is a local path without any protocol, without fully parsing it."""
+    return isinstance(filename, pathlib.Path) or (isinstance(filename, str) and "://" not in filename)
+
+
 def _sort_files_to_local_remote_and_fsfiles(filenames):
     from satpy.readers import FSFile
 